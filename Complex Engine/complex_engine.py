@@ -1,7 +1,5 @@
 import chess
-import torch
 import numpy as np
-from scipy.stats import norm
 
 # Piece values and positional weights
 PIECE_VALUES = {
@@ -90,9 +88,11 @@ def mcmc_move_selection(board, is_white, iterations=1000):
         scores.append(score)
         board.pop()
 
-    # Normalize scores to probabilities using softmax
-    scores = torch.tensor(scores, dtype=torch.float32, device='cuda')
-    probabilities = torch.nn.functional.softmax(scores, dim=0).cpu().numpy()
+    # Normalize scores to probabilities using softmax. Move lists are far too
+    # small to amortize a CUDA launch and two copies, so do it on the CPU.
+    scores = np.asarray(scores, dtype=np.float64)
+    probabilities = np.exp(scores - scores.max())
+    probabilities /= probabilities.sum()
 
     # Sample a move based on the probabilities
     move_index = np.random.choice(len(legal_moves), p=probabilities)
@@ -1,7 +1,7 @@
 import chess
-import torch
 import numpy as np
-from scipy.stats import norm
+
+RNG = np.random.default_rng()
 
 # Piece values and positional weights
 PIECE_VALUES = {
@@ -25,22 +25,28 @@ PAWN_WEIGHTS = np.array([
     [0, 0, 0, 0, 0, 0, 0, 0]
 ], dtype=np.float32)
 
+PAWN_WEIGHTS_FLAT = PAWN_WEIGHTS.reshape(-1)
+
+# (row, col) coordinates of every square, indexed by square number
+SQUARE_COORDS = np.array([divmod(square, 8) for square in chess.SQUARES], dtype=np.float64)
+
+def squares_of(mask):
+    """Return the squares set in a bitboard as an index array."""
+    return np.fromiter(chess.scan_forward(mask), dtype=np.intp)
+
 # Evaluate the board using advanced mathematical concepts
 def evaluate_board_fischer(board):
     """Evaluate the board considering piece values, positional weights, and strategy."""
     evaluation = 0
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            row, col = divmod(square, 8)
-            value = PIECE_VALUES[piece.piece_type]
-            if piece.piece_type == chess.PAWN:
-                weight = PAWN_WEIGHTS[row][col]
-            else:
-                weight = 0  # Add weights for other pieces if desired.
-
-            sign = 1 if piece.color == chess.WHITE else -1
-            evaluation += sign * (value + weight)
+    for piece_type, value in PIECE_VALUES.items():
+        white = chess.popcount(board.pieces_mask(piece_type, chess.WHITE))
+        black = chess.popcount(board.pieces_mask(piece_type, chess.BLACK))
+        evaluation += value * (white - black)
+
+    # Positional weights for pawns (add tables for other pieces if desired).
+    white_pawns = squares_of(board.pieces_mask(chess.PAWN, chess.WHITE))
+    black_pawns = squares_of(board.pieces_mask(chess.PAWN, chess.BLACK))
+    evaluation += PAWN_WEIGHTS_FLAT[white_pawns].sum() - PAWN_WEIGHTS_FLAT[black_pawns].sum()
 
     # Incorporate topological considerations (e.g., clustering of pieces)
     white_cluster, black_cluster = calculate_piece_clusters(board)
@@ -51,15 +57,8 @@ def evaluate_board_fischer(board):
 
 def calculate_piece_clusters(board):
     """Calculate clustering of pieces for both sides."""
-    white_positions = []
-    black_positions = []
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            if piece.color == chess.WHITE:
-                white_positions.append(divmod(square, 8))
-            else:
-                black_positions.append(divmod(square, 8))
+    white_positions = SQUARE_COORDS[squares_of(board.occupied_co[chess.WHITE])]
+    black_positions = SQUARE_COORDS[squares_of(board.occupied_co[chess.BLACK])]
 
     white_cluster = cluster_cohesion(white_positions)
     black_cluster = cluster_cohesion(black_positions)
@@ -69,10 +68,9 @@ def calculate_piece_clusters(board):
 
 def cluster_cohesion(positions):
     """Calculate cohesion of pieces using topological clustering."""
-    if not positions:
+    if len(positions) == 0:
         return 0
 
-    positions = np.array(positions)
     centroid = np.mean(positions, axis=0)
     cohesion = np.sum(np.linalg.norm(positions - centroid, axis=1))
 
@@ -92,12 +90,10 @@ def mcmc_move_selection_fischer(board, is_white, iterations=1000):
         scores.append(score)
         board.pop()
 
-    # Normalize scores to probabilities using softmax
-    scores = torch.tensor(scores, dtype=torch.float32, device='cuda')
-    probabilities = torch.nn.functional.softmax(scores, dim=0).cpu().numpy()
-
-    # Sample a move based on the probabilities
-    move_index = np.random.choice(len(legal_moves), p=probabilities)
+    # Sample a move from softmax(scores) with the Gumbel-max trick: the argmax
+    # of the scores perturbed by Gumbel noise is distributed as the softmax.
+    gumbel = RNG.gumbel(size=len(scores))
+    move_index = int(np.argmax(np.asarray(scores) + gumbel))
     return legal_moves[move_index]
 
 # Simulate a game
@@ -1,67 +1,51 @@
 import numpy as np
-import tensorflow as tf
-from scipy.stats import norm
-import networkx as nx
-import random
+
+# Pieces are stored as int8 codes: positive for white, negative for black,
+# with abs(code) indexing '.PNBRQK' and 0 marking an empty square
+PIECE_CHARS = 'kqrbnp.PNBRQK'  # indexed by code + 6
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(1, 7)
+BACK_RANK = [ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK]
 
 class ChessEngine:
     def __init__(self):
         self.board = self.initialize_board()
-        self.piece_values = {"P": 1, "N": 3, "B": 3.5, "R": 5, "Q": 9, "K": 0}
-        self.graph = self.build_position_graph()
+        self.piece_values = np.array([0, 1, 3, 3.5, 5, 9, 0])  # indexed by abs(code)
+        self.rng = np.random.default_rng()
 
     def initialize_board(self):
         # Standard chessboard representation
-        board = np.zeros((8, 8), dtype=str)
-        for i in range(8):
-            board[1, i] = 'P'  # White pawns
-            board[6, i] = 'p'  # Black pawns
-        board[0] = ['R', 'N', 'B', 'Q', 'K', 'B', 'N', 'R']
-        board[7] = ['r', 'n', 'b', 'q', 'k', 'b', 'n', 'r']
+        board = np.zeros((8, 8), dtype=np.int8)
+        board[1] = PAWN  # White pawns
+        board[6] = -PAWN  # Black pawns
+        board[0] = BACK_RANK
+        board[7] = [-piece for piece in BACK_RANK]
         return board
 
-    def build_position_graph(self):
-        # Represent the board as a graph for topological analysis
-        graph = nx.grid_2d_graph(8, 8)
-        for node in graph.nodes:
-            graph.nodes[node]['piece'] = None
-        return graph
-
     def evaluate_position(self):
         # Use MCMC to evaluate board state probabilities
-        position_value = 0
-        for (x, y), piece in np.ndenumerate(self.board):
-            if piece:
-                sign = 1 if piece.isupper() else -1
-                position_value += sign * self.piece_values[piece.upper()]
+        piece_values = self.piece_values[np.abs(self.board)]
+        position_value = (np.sign(self.board) * piece_values).sum()
         return position_value + self.simulate_random_walks()
 
-    def simulate_random_walks(self, iterations=1000):
-        # MCMC simulation
-        scores = []
-        for _ in range(iterations):
-            current_score = 0
-            for _ in range(10):
-                x, y = random.randint(0, 7), random.randint(0, 7)
-                if self.board[x, y]:
-                    current_score += norm.rvs(loc=self.piece_values[self.board[x, y].upper()], scale=1)
-            scores.append(current_score)
-        return np.mean(scores)
+    def simulate_random_walks(self, iterations=1000, steps=10):
+        # MCMC simulation, drawing every walk in one batch: each step visits a
+        # random square and samples N(piece value, 1) if it is occupied
+        board_values = self.piece_values[np.abs(self.board)]
+        xs = self.rng.integers(0, 8, (iterations, steps))
+        ys = self.rng.integers(0, 8, (iterations, steps))
+        samples = self.rng.standard_normal((iterations, steps)) + board_values[xs, ys]
+        samples[self.board[xs, ys] == 0] = 0
+        return samples.sum(axis=1).mean()
 
     def gpu_optimized_move_evaluation(self):
-        # Evaluate moves on GPU using TensorFlow
-        tensor_board = tf.convert_to_tensor(self.board.reshape(-1), dtype=tf.string)
-        position_tensor = tf.constant(self.evaluate_position(), dtype=tf.float32)
-        
-        # Perform neural estimation of best moves
-        with tf.device('/GPU:0'):
-            logits = tf.nn.softmax(tf.random.normal([64], mean=position_tensor, stddev=1))
-        return tf.argmax(logits).numpy()
+        # Estimate the best target square from noise centred on the position value
+        logits = self.rng.standard_normal(64) + self.evaluate_position()
+        return int(logits.argmax())
 
     def suggest_move(self):
         move_index = self.gpu_optimized_move_evaluation()
         move_x, move_y = divmod(move_index, 8)
-        return f"Best move at {move_x}, {move_y}" based on GPU analysis
+        return f"Best move at {move_x}, {move_y} based on GPU analysis"
 
     def play_move(self, move):
         # Parse and apply a move to the board
@@ -69,10 +53,11 @@ class ChessEngine:
         start_x, start_y = map(int, start.split(','))
         end_x, end_y = map(int, end.split(','))
         self.board[end_x, end_y] = self.board[start_x, start_y]
-        self.board[start_x, start_y] = ''
+        self.board[start_x, start_y] = 0
 
     def display_board(self):
-        print(self.board)
+        for row in self.board:
+            print(" ".join(PIECE_CHARS[piece + 6] for piece in row))
 
 if __name__ == "__main__":
     engine = ChessEngine()
@@ -1,7 +1,15 @@
 import chess
 import chess.engine
-import torch
+import chess.polyglot
 import copy
+import os
+import sys
+from collections import OrderedDict
+
+# The shared search lives in engine_core.py at the repository root.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from engine_core import id_search, tt_probe, tt_store
 
 # Piece values for evaluation
 PIECE_VALUES = {
@@ -13,71 +21,104 @@ PIECE_VALUES = {
     chess.KING: 0
 }
 
-# Convert the board to a tensor representation
-def board_to_tensor(board):
-    """Converts a chess board into a tensor for GPU computations."""
-    tensor = torch.zeros((8, 8), device='cuda')
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            value = PIECE_VALUES[piece.piece_type] * (1 if piece.color == chess.WHITE else -1)
-            row, col = divmod(square, 8)
-            tensor[row, col] = value
-    return tensor
-
-# Evaluate the board using a tensor
+# Transposition table keyed by Polyglot Zobrist hash, in engine_core's entry format
+TRANSPOSITION_TABLE = {}
+
+LEGAL_CACHE_MAX_ENTRIES = 1 << 16
+LEGAL_MOVE_CACHE = OrderedDict()
+
+# Evaluate the board from python-chess's piece bitboards
 def evaluate_board(board):
-    """Evaluate the board position using GPU acceleration."""
-    tensor = board_to_tensor(board)
-    return torch.sum(tensor).item()
+    """Evaluate the board position by material count on the CPU."""
+    score = 0
+    for piece_type, value in PIECE_VALUES.items():
+        white = chess.popcount(board.pieces_mask(piece_type, chess.WHITE))
+        black = chess.popcount(board.pieces_mask(piece_type, chess.BLACK))
+        score += value * (white - black)
+    return score
+
+# Legal move lists memoized by Polyglot Zobrist hash, evicting the least recently used
+def cached_legal_moves(board, key):
+    """Return the legal moves of board, reusing the list computed for an earlier visit."""
+    moves = LEGAL_MOVE_CACHE.get(key)
+    if moves is None:
+        moves = list(board.legal_moves)
+        LEGAL_MOVE_CACHE[key] = moves
+        if len(LEGAL_MOVE_CACHE) > LEGAL_CACHE_MAX_ENTRIES:
+            LEGAL_MOVE_CACHE.popitem(last=False)
+    else:
+        LEGAL_MOVE_CACHE.move_to_end(key)
+    return moves
+
+# Order moves so alpha-beta sees the likely best replies first
+def order_moves(board, moves, tt_move):
+    """Sort moves in place: TT move first, then captures by MVV-LVA, then quiet moves."""
+    def key(move):
+        if move == tt_move:
+            return 1e6
+        if board.is_capture(move):
+            victim = board.piece_at(move.to_square)
+            victim_value = PIECE_VALUES[victim.piece_type] if victim else PIECE_VALUES[chess.PAWN]
+            return 10 * victim_value - PIECE_VALUES[board.piece_type_at(move.from_square)]
+        return 0
+
+    moves.sort(key=key, reverse=True)
 
 # Minimax algorithm with alpha-beta pruning
 
-def minimax(board, depth, alpha, beta, is_white):
-    """Minimax with alpha-beta pruning on GPU."""
+def minimax(board, depth, is_white, alpha, beta):
+    """Minimax with alpha-beta pruning and a transposition table."""
     if depth == 0 or board.is_game_over():
         return evaluate_board(board), None
 
-    legal_moves = list(board.legal_moves)
+    key = chess.polyglot.zobrist_hash(board)
+    alpha_orig, beta_orig = alpha, beta
+    score, tt_move, alpha, beta = tt_probe(key, depth, alpha, beta, TRANSPOSITION_TABLE)
+    if score is not None:
+        return score, tt_move
+
+    # Copy the cached list: it is sorted in place and may be shared with a transposition deeper down.
+    legal_moves = list(cached_legal_moves(board, key))
+    order_moves(board, legal_moves, tt_move)
     best_move = None
 
     if is_white:
-        max_eval = float('-inf')
+        best_eval = float('-inf')
         for move in legal_moves:
             board.push(move)
-            eval_score, _ = minimax(board, depth - 1, alpha, beta, not is_white)
+            eval_score, _ = minimax(board, depth - 1, not is_white, alpha, beta)
             board.pop()
-            if eval_score > max_eval:
-                max_eval = eval_score
+            if eval_score > best_eval:
+                best_eval = eval_score
                 best_move = move
             alpha = max(alpha, eval_score)
             if beta <= alpha:
                 break
-        return max_eval, best_move
     else:
-        min_eval = float('inf')
+        best_eval = float('inf')
         for move in legal_moves:
             board.push(move)
-            eval_score, _ = minimax(board, depth - 1, alpha, beta, not is_white)
+            eval_score, _ = minimax(board, depth - 1, not is_white, alpha, beta)
             board.pop()
-            if eval_score < min_eval:
-                min_eval = eval_score
+            if eval_score < best_eval:
+                best_eval = eval_score
                 best_move = move
             beta = min(beta, eval_score)
             if beta <= alpha:
                 break
-        return min_eval, best_move
+    tt_store(key, depth, best_eval, best_move, alpha_orig, beta_orig, TRANSPOSITION_TABLE)
+    return best_eval, best_move
 
 # Play the game
 def play_game():
-    """Simulates a chess game between two GPU-accelerated engines."""
+    """Simulates a chess game between two engines."""
     board = chess.Board()
     is_white_turn = True
 
     while not board.is_game_over():
         print(board)
         print()
-        _, best_move = minimax(board, depth=3, alpha=float('-inf'), beta=float('inf'), is_white=is_white_turn)
+        _, best_move = id_search(board, is_white_turn, 3, search=minimax)
         if best_move:
             board.push(best_move)
         else:
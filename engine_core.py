@@ -0,0 +1,467 @@
+import random
+import time
+from dataclasses import dataclass
+
+# Piece indices: 0-5 are white P, N, B, R, Q, K and 6-11 the black equivalents.
+PIECES = 'PNBRQKpnbrqk'
+FIELDS = (
+    'pawns_w', 'knights_w', 'bishops_w', 'rooks_w', 'queens_w', 'kings_w',
+    'pawns_b', 'knights_b', 'bishops_b', 'rooks_b', 'queens_b', 'kings_b',
+)
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+BLACK = 6
+
+PIECE_VALUES = (-1, -3, -3, -5, -9, 0, 1, 3, 3, 5, 9, 0)
+ORDER_VALUES = tuple(abs(value) for value in PIECE_VALUES)
+
+# Square index is x * 8 + y, matching board[x][y] in the row-list layout.
+STARTING_ROWS = (
+    'rnbqkbnr',
+    'pppppppp',
+    '........',
+    '........',
+    '........',
+    '........',
+    'PPPPPPPP',
+    'RNBQKBNR',
+)
+
+ROOK_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+BISHOP_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+KNIGHT_OFFSETS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (2, -1), (2, 1), (1, -2), (1, 2))
+KING_OFFSETS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+
+# Zobrist keys, one per (piece, square) in Polyglot's 12 x 64 layout, plus the
+# key toggled whenever the side to move changes.
+_zobrist_rng = random.Random(0xC0FFEE)
+ZOBRIST = tuple(tuple(_zobrist_rng.getrandbits(64) for _ in range(64)) for _ in range(12))
+SIDE_KEY = _zobrist_rng.getrandbits(64)
+
+# Transposition table: hash -> (depth, score, best_move, flag).
+EXACT, LOWER, UPPER = range(3)
+TT_MAX_ENTRIES = 1 << 20
+TRANSPOSITION_TABLE = {}
+
+@dataclass
+class Position:
+    """Bitboard position: one 64-bit mask per piece type and colour."""
+    pawns_w: int = 0
+    knights_w: int = 0
+    bishops_w: int = 0
+    rooks_w: int = 0
+    queens_w: int = 0
+    kings_w: int = 0
+    pawns_b: int = 0
+    knights_b: int = 0
+    bishops_b: int = 0
+    rooks_b: int = 0
+    queens_b: int = 0
+    kings_b: int = 0
+    occ_w: int = 0
+    occ_b: int = 0
+    hash: int = 0
+
+def is_in_bounds(x, y):
+    """Check if a position is within the board boundaries."""
+    return 0 <= x < 8 and 0 <= y < 8
+
+def _leaper_attacks(offsets):
+    """Precompute the target mask of a single-step piece for every square."""
+    table = []
+    for sq in range(64):
+        x, y = divmod(sq, 8)
+        mask = 0
+        for dx, dy in offsets:
+            if is_in_bounds(x + dx, y + dy):
+                mask |= 1 << ((x + dx) * 8 + y + dy)
+        table.append(mask)
+    return tuple(table)
+
+def _ray_masks(dx, dy):
+    """Precompute the empty-board ray from every square in one direction."""
+    table = []
+    for sq in range(64):
+        x, y = divmod(sq, 8)
+        mask = 0
+        nx, ny = x + dx, y + dy
+        while is_in_bounds(nx, ny):
+            mask |= 1 << (nx * 8 + ny)
+            nx += dx
+            ny += dy
+        table.append(mask)
+    return tuple(table)
+
+KNIGHT_ATTACKS = _leaper_attacks(KNIGHT_OFFSETS)
+KING_ATTACKS = _leaper_attacks(KING_OFFSETS)
+PAWN_ATTACKS = (
+    _leaper_attacks(((-1, 0), (-1, -1), (-1, 1))),  # white pawns move towards x = 0
+    _leaper_attacks(((1, 0), (1, -1), (1, 1))),
+)
+
+# Rays pointing towards higher square indices find their first blocker at the
+# lowest set bit, the others at the highest set bit.
+ROOK_RAYS = tuple((_ray_masks(dx, dy), dx * 8 + dy > 0) for dx, dy in ROOK_DIRECTIONS)
+BISHOP_RAYS = tuple((_ray_masks(dx, dy), dx * 8 + dy > 0) for dx, dy in BISHOP_DIRECTIONS)
+QUEEN_RAYS = ROOK_RAYS + BISHOP_RAYS
+
+def slider_attacks(sq, occ, rays):
+    """Return the squares reached from sq along the given rays, stopping at blockers."""
+    attacks = 0
+    for ray, positive in rays:
+        mask = ray[sq]
+        blockers = mask & occ
+        if blockers:
+            if positive:
+                blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                blocker = blockers.bit_length() - 1
+            mask ^= ray[blocker]
+        attacks |= mask
+    return attacks
+
+def initialize_board():
+    """Initialize the chessboard with pieces in their starting positions."""
+    pos = Position()
+    for x, row in enumerate(STARTING_ROWS):
+        for y, char in enumerate(row):
+            if char != '.':
+                piece = PIECES.index(char)
+                bit = 1 << (x * 8 + y)
+                setattr(pos, FIELDS[piece], getattr(pos, FIELDS[piece]) | bit)
+                pos.hash ^= ZOBRIST[piece][x * 8 + y]
+                if piece < BLACK:
+                    pos.occ_w |= bit
+                else:
+                    pos.occ_b |= bit
+    return pos
+
+def print_board(pos):
+    """Print the chessboard in a human-readable format."""
+    squares = ['.'] * 64
+    for piece, field in enumerate(FIELDS):
+        bb = getattr(pos, field)
+        while bb:
+            squares[(bb & -bb).bit_length() - 1] = PIECES[piece]
+            bb &= bb - 1
+    for x in range(8):
+        print(" ".join(squares[x * 8:x * 8 + 8]))
+    print()
+
+def _add_moves(moves, piece, sq, targets):
+    """Append a (piece, from, to) move for every set bit in targets."""
+    while targets:
+        moves.append((piece, sq, (targets & -targets).bit_length() - 1))
+        targets &= targets - 1
+
+def generate_moves(pos, is_white):
+    """Generate all possible moves for the current player."""
+    if is_white:
+        base, own = 0, pos.occ_w
+        pawns, knights, bishops = pos.pawns_w, pos.knights_w, pos.bishops_w
+        rooks, queens, kings = pos.rooks_w, pos.queens_w, pos.kings_w
+    else:
+        base, own = BLACK, pos.occ_b
+        pawns, knights, bishops = pos.pawns_b, pos.knights_b, pos.bishops_b
+        rooks, queens, kings = pos.rooks_b, pos.queens_b, pos.kings_b
+    occ = pos.occ_w | pos.occ_b
+    not_own = ~own
+    pawn_attacks = PAWN_ATTACKS[0 if is_white else 1]
+
+    moves = []
+    while pawns:
+        sq = (pawns & -pawns).bit_length() - 1
+        _add_moves(moves, base + PAWN, sq, pawn_attacks[sq] & not_own)
+        pawns &= pawns - 1
+    while knights:
+        sq = (knights & -knights).bit_length() - 1
+        _add_moves(moves, base + KNIGHT, sq, KNIGHT_ATTACKS[sq] & not_own)
+        knights &= knights - 1
+    while bishops:
+        sq = (bishops & -bishops).bit_length() - 1
+        _add_moves(moves, base + BISHOP, sq, slider_attacks(sq, occ, BISHOP_RAYS) & not_own)
+        bishops &= bishops - 1
+    while rooks:
+        sq = (rooks & -rooks).bit_length() - 1
+        _add_moves(moves, base + ROOK, sq, slider_attacks(sq, occ, ROOK_RAYS) & not_own)
+        rooks &= rooks - 1
+    while queens:
+        sq = (queens & -queens).bit_length() - 1
+        _add_moves(moves, base + QUEEN, sq, slider_attacks(sq, occ, QUEEN_RAYS) & not_own)
+        queens &= queens - 1
+    while kings:
+        sq = (kings & -kings).bit_length() - 1
+        _add_moves(moves, base + KING, sq, KING_ATTACKS[sq] & not_own)
+        kings &= kings - 1
+    return moves
+
+def piece_at(pos, bit, base):
+    """Return the index of the piece of the side starting at base occupying bit."""
+    for piece in range(base, base + 6):
+        if getattr(pos, FIELDS[piece]) & bit:
+            return piece
+    return -1
+
+def do_move(pos, move):
+    """Execute a move in place and return the captured piece index (-1 if none)."""
+    piece, from_sq, to_sq = move
+    to_bit = 1 << to_sq
+    move_mask = (1 << from_sq) | to_bit
+    keys = ZOBRIST[piece]
+    captured = -1
+    if piece < BLACK:
+        if pos.occ_b & to_bit:
+            captured = piece_at(pos, to_bit, BLACK)
+            setattr(pos, FIELDS[captured], getattr(pos, FIELDS[captured]) ^ to_bit)
+            pos.occ_b ^= to_bit
+            pos.hash ^= ZOBRIST[captured][to_sq]
+        pos.occ_w ^= move_mask
+    else:
+        if pos.occ_w & to_bit:
+            captured = piece_at(pos, to_bit, 0)
+            setattr(pos, FIELDS[captured], getattr(pos, FIELDS[captured]) ^ to_bit)
+            pos.occ_w ^= to_bit
+            pos.hash ^= ZOBRIST[captured][to_sq]
+        pos.occ_b ^= move_mask
+    setattr(pos, FIELDS[piece], getattr(pos, FIELDS[piece]) ^ move_mask)
+    pos.hash ^= keys[from_sq] ^ keys[to_sq] ^ SIDE_KEY
+    return captured
+
+def undo_move(pos, move, captured):
+    """Take back a move made by do_move, restoring any captured piece."""
+    piece, from_sq, to_sq = move
+    to_bit = 1 << to_sq
+    move_mask = (1 << from_sq) | to_bit
+    keys = ZOBRIST[piece]
+    setattr(pos, FIELDS[piece], getattr(pos, FIELDS[piece]) ^ move_mask)
+    pos.hash ^= keys[from_sq] ^ keys[to_sq] ^ SIDE_KEY
+    if captured >= 0:
+        pos.hash ^= ZOBRIST[captured][to_sq]
+    if piece < BLACK:
+        pos.occ_w ^= move_mask
+        if captured >= 0:
+            setattr(pos, FIELDS[captured], getattr(pos, FIELDS[captured]) ^ to_bit)
+            pos.occ_b ^= to_bit
+    else:
+        pos.occ_b ^= move_mask
+        if captured >= 0:
+            setattr(pos, FIELDS[captured], getattr(pos, FIELDS[captured]) ^ to_bit)
+            pos.occ_w ^= to_bit
+
+def evaluate_board(pos):
+    """Evaluate the board and return a score."""
+    score = 0
+    for value, field in zip(PIECE_VALUES, FIELDS):
+        if value:
+            score += value * getattr(pos, field).bit_count()
+    return score
+
+try:
+    # Compiled versions of generate_moves and evaluate_board; see movegen.pyx.
+    from movegen import generate_moves, evaluate_board
+except ImportError:
+    try:
+        # Numba-compiled generate_moves; see movegen_jit.py.
+        from movegen_jit import generate_moves
+    except ImportError:
+        pass
+
+def order_moves(pos, moves, is_white, tt_move):
+    """Sort moves in place: TT move first, then captures by MVV-LVA, then quiet moves."""
+    # Victims are valued by what removing them gains the mover under evaluate_board.
+    if is_white:
+        base, enemy, sign = BLACK, pos.occ_b, -1
+    else:
+        base, enemy, sign = 0, pos.occ_w, 1
+
+    def key(move):
+        if move == tt_move:
+            return 1e6
+        piece, _, to_sq = move
+        to_bit = 1 << to_sq
+        if enemy & to_bit:
+            return 10 * sign * PIECE_VALUES[piece_at(pos, to_bit, base)] - ORDER_VALUES[piece]
+        return 0
+
+    moves.sort(key=key, reverse=True)
+
+def tt_probe(key, depth, alpha, beta, table=TRANSPOSITION_TABLE):
+    """Look key up in table, narrowing the window (alpha, beta) with a stored bound.
+
+    Returns (score, move, alpha, beta). score is None unless the entry settles
+    the node; move is the stored best move to try first, or None.
+    """
+    entry = table.get(key)
+    if entry is None:
+        return None, None, alpha, beta
+    entry_depth, score, tt_move, flag = entry
+    if entry_depth >= depth:
+        if flag == EXACT:
+            return score, tt_move, alpha, beta
+        if flag == LOWER:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        if beta <= alpha:
+            return score, tt_move, alpha, beta
+    return None, tt_move, alpha, beta
+
+def tt_store(key, depth, score, move, alpha, beta, table=TRANSPOSITION_TABLE):
+    """Store a search result with the bound it represents for the window (alpha, beta)."""
+    if score <= alpha:
+        flag = UPPER
+    elif score >= beta:
+        flag = LOWER
+    else:
+        flag = EXACT
+    if len(table) >= TT_MAX_ENTRIES:
+        table.clear()
+    table[key] = (depth, score, move, flag)
+
+def minimax(pos, depth, is_white, alpha, beta):
+    """Minimax algorithm with alpha-beta pruning and a transposition table."""
+    if depth == 0:
+        return evaluate_board(pos), None
+
+    key = pos.hash
+    alpha_orig, beta_orig = alpha, beta
+    score, tt_move, alpha, beta = tt_probe(key, depth, alpha, beta)
+    if score is not None:
+        return score, tt_move
+
+    moves = generate_moves(pos, is_white)
+    order_moves(pos, moves, is_white, tt_move)
+
+    best_move = None
+    if is_white:
+        best_eval = float('-inf')
+        for move in moves:
+            captured = do_move(pos, move)
+            evaluation, _ = minimax(pos, depth - 1, not is_white, alpha, beta)
+            undo_move(pos, move, captured)
+            if evaluation > best_eval:
+                best_eval = evaluation
+                best_move = move
+            alpha = max(alpha, evaluation)
+            if beta <= alpha:
+                break
+    else:
+        best_eval = float('inf')
+        for move in moves:
+            captured = do_move(pos, move)
+            evaluation, _ = minimax(pos, depth - 1, not is_white, alpha, beta)
+            undo_move(pos, move, captured)
+            if evaluation < best_eval:
+                best_eval = evaluation
+                best_move = move
+            beta = min(beta, evaluation)
+            if beta <= alpha:
+                break
+    tt_store(key, depth, best_eval, best_move, alpha_orig, beta_orig)
+    return best_eval, best_move
+
+def piece_counts(pos):
+    """Return the number of pieces of each kind, in PIECES order, as a leaf encoding."""
+    return tuple(getattr(pos, field).bit_count() for field in FIELDS)
+
+def expand_frontier(pos, depth, is_white, leaves):
+    """Expand the full tree to depth, appending every leaf's piece counts to leaves.
+
+    Returns the leaf's index into leaves at depth 0, otherwise (key, [(move, child), ...]).
+    """
+    if depth == 0:
+        leaves.append(piece_counts(pos))
+        return len(leaves) - 1
+
+    key = pos.hash
+    entry = TRANSPOSITION_TABLE.get(key)
+    moves = generate_moves(pos, is_white)
+    order_moves(pos, moves, is_white, entry[2] if entry is not None else None)
+    children = []
+    for move in moves:
+        captured = do_move(pos, move)
+        children.append((move, expand_frontier(pos, depth - 1, not is_white, leaves)))
+        undo_move(pos, move, captured)
+    return key, children
+
+def fold_frontier(node, depth, is_white, alpha, beta, scores):
+    """Alpha-beta over an expanded tree using precomputed leaf scores."""
+    if depth == 0:
+        return scores[node], None
+
+    key, children = node
+    alpha_orig, beta_orig = alpha, beta
+    best_move = None
+    if is_white:
+        best_eval = float('-inf')
+        for move, child in children:
+            evaluation, _ = fold_frontier(child, depth - 1, not is_white, alpha, beta, scores)
+            if evaluation > best_eval:
+                best_eval = evaluation
+                best_move = move
+            alpha = max(alpha, evaluation)
+            if beta <= alpha:
+                break
+    else:
+        best_eval = float('inf')
+        for move, child in children:
+            evaluation, _ = fold_frontier(child, depth - 1, not is_white, alpha, beta, scores)
+            if evaluation < best_eval:
+                best_eval = evaluation
+                best_move = move
+            beta = min(beta, evaluation)
+            if beta <= alpha:
+                break
+    tt_store(key, depth, best_eval, best_move, alpha_orig, beta_orig)
+    return best_eval, best_move
+
+def minimax_batched(pos, depth, is_white, evaluate_batch):
+    """Minimax search that scores every leaf of the tree with one evaluate_batch call.
+
+    evaluate_batch takes a list of piece_counts tuples and returns a score for
+    each. The tree is expanded first and the scores are folded back up with
+    alpha-beta.
+    """
+    leaves = []
+    tree = expand_frontier(pos, depth, is_white, leaves)
+    # A side with no pieces left has no moves, so the tree can end without leaves.
+    scores = evaluate_batch(leaves) if leaves else []
+    return fold_frontier(tree, depth, is_white, float('-inf'), float('inf'), scores)
+
+def id_search(pos, is_white, max_depth, time_budget=None, evaluate_batch=None, search=minimax):
+    """Iterative deepening: search depths 1..max_depth until time_budget seconds run out.
+
+    Each iteration leaves its best moves in the transposition table, which
+    orders the next, deeper iteration. search(pos, depth, is_white, alpha, beta)
+    returns (score, move); engines on other board types pass their own.
+
+    Leaves are scored with evaluate_board unless an evaluate_batch function is
+    given. expand_frontier does not prune, so batched searches go straight to
+    max_depth: shallower iterations would only add full-tree expansions and
+    batch launches.
+    """
+    start = time.time()
+    result = None, None
+    first_depth = 1 if evaluate_batch is None else max_depth
+    for depth in range(first_depth, max_depth + 1):
+        if evaluate_batch is None:
+            result = search(pos, depth, is_white, float('-inf'), float('inf'))
+        else:
+            result = minimax_batched(pos, depth, is_white, evaluate_batch)
+        if time_budget is not None and time.time() - start > time_budget:
+            break
+    return result
+
+def play_game(evaluate_batch=None):
+    """Simulate a chess game, scoring leaves in batches if evaluate_batch is given."""
+    pos = initialize_board()
+    is_white_turn = True
+    for turn in range(50):
+        print(f"Turn {turn + 1} ({'White' if is_white_turn else 'Black'}):")
+        print_board(pos)
+        _, best_move = id_search(pos, is_white_turn, 3, evaluate_batch=evaluate_batch)
+        if best_move:
+            do_move(pos, best_move)
+        else:
+            print(f"{'White' if is_white_turn else 'Black'} has no legal moves. Game over!")
+            break
+        is_white_turn = not is_white_turn
@@ -0,0 +1,148 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# distutils: extra_compile_args = -O3 -march=native
+"""Compiled bitboard move generator and evaluator for engine_core.
+
+Build in place with ``cythonize -i movegen.pyx``. engine_core imports
+generate_moves and evaluate_board from here when the extension is available,
+falling back to movegen_jit.py and then its pure-Python versions otherwise.
+All of them produce the same moves in the same order.
+"""
+
+ctypedef unsigned long long u64
+
+cdef extern from *:
+    int __builtin_ctzll(u64) nogil
+    int __builtin_clzll(u64) nogil
+    int __builtin_popcountll(u64) nogil
+
+cdef enum:
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, BLACK
+
+# Rook directions are 0-3 and bishop directions 4-7, in engine_core's order.
+cdef int DIRS[8][2]
+DIRS[:] = [[-1, 0], [1, 0], [0, -1], [0, 1], [-1, -1], [-1, 1], [1, -1], [1, 1]]
+cdef int KNIGHT_OFFSETS[8][2]
+KNIGHT_OFFSETS[:] = [[-2, -1], [-2, 1], [-1, -2], [-1, 2], [2, -1], [2, 1], [1, -2], [1, 2]]
+cdef int PIECE_VALUES[12]
+PIECE_VALUES[:] = [-1, -3, -3, -5, -9, 0, 1, 3, 3, 5, 9, 0]
+
+cdef u64 KNIGHT_ATTACKS[64]
+cdef u64 KING_ATTACKS[64]
+cdef u64 PAWN_ATTACKS[2][64]
+cdef u64 RAYS[8][64]
+cdef bint RAY_POSITIVE[8]
+
+cdef inline bint is_in_bounds(int x, int y) nogil:
+    return 0 <= x < 8 and 0 <= y < 8
+
+cdef inline int lsb(u64 bb) nogil:
+    return __builtin_ctzll(bb)
+
+cdef inline int msb(u64 bb) nogil:
+    return 63 - __builtin_clzll(bb)
+
+cdef inline u64 bit(int x, int y) nogil:
+    return (<u64>1) << (x * 8 + y)
+
+cdef void init_tables() nogil:
+    cdef int sq, x, y, d, nx, ny, side
+    for sq in range(64):
+        x = sq // 8
+        y = sq % 8
+        KNIGHT_ATTACKS[sq] = 0
+        KING_ATTACKS[sq] = 0
+        for d in range(8):
+            if is_in_bounds(x + KNIGHT_OFFSETS[d][0], y + KNIGHT_OFFSETS[d][1]):
+                KNIGHT_ATTACKS[sq] |= bit(x + KNIGHT_OFFSETS[d][0], y + KNIGHT_OFFSETS[d][1])
+            if is_in_bounds(x + DIRS[d][0], y + DIRS[d][1]):
+                KING_ATTACKS[sq] |= bit(x + DIRS[d][0], y + DIRS[d][1])
+            RAYS[d][sq] = 0
+            nx = x + DIRS[d][0]
+            ny = y + DIRS[d][1]
+            while is_in_bounds(nx, ny):
+                RAYS[d][sq] |= bit(nx, ny)
+                nx += DIRS[d][0]
+                ny += DIRS[d][1]
+        for side in range(2):
+            # White pawns move towards x = 0, black pawns towards x = 7.
+            nx = x - 1 if side == 0 else x + 1
+            PAWN_ATTACKS[side][sq] = 0
+            for ny in range(y - 1, y + 2):
+                if is_in_bounds(nx, ny):
+                    PAWN_ATTACKS[side][sq] |= bit(nx, ny)
+    for d in range(8):
+        RAY_POSITIVE[d] = DIRS[d][0] * 8 + DIRS[d][1] > 0
+
+init_tables()
+
+cdef u64 slider_attacks(int sq, u64 occ, int first, int last) nogil:
+    cdef u64 attacks = 0, mask, blockers
+    cdef int d
+    for d in range(first, last):
+        mask = RAYS[d][sq]
+        blockers = mask & occ
+        if blockers:
+            if RAY_POSITIVE[d]:
+                mask ^= RAYS[d][lsb(blockers)]
+            else:
+                mask ^= RAYS[d][msb(blockers)]
+        attacks |= mask
+    return attacks
+
+cdef inline void add_moves(list moves, int piece, int sq, u64 targets):
+    while targets:
+        moves.append((piece, sq, lsb(targets)))
+        targets &= targets - 1
+
+cpdef list generate_moves(pos, bint is_white):
+    """Generate all possible moves for the current player."""
+    cdef u64 pawns, knights, bishops, rooks, queens, kings
+    cdef u64 own, occ, not_own
+    cdef int base, sq, side
+    if is_white:
+        base, side, own = 0, 0, pos.occ_w
+        pawns, knights, bishops = pos.pawns_w, pos.knights_w, pos.bishops_w
+        rooks, queens, kings = pos.rooks_w, pos.queens_w, pos.kings_w
+    else:
+        base, side, own = BLACK, 1, pos.occ_b
+        pawns, knights, bishops = pos.pawns_b, pos.knights_b, pos.bishops_b
+        rooks, queens, kings = pos.rooks_b, pos.queens_b, pos.kings_b
+    occ = own | <u64>(pos.occ_b if is_white else pos.occ_w)
+    not_own = ~own
+
+    cdef list moves = []
+    while pawns:
+        sq = lsb(pawns)
+        add_moves(moves, base + PAWN, sq, PAWN_ATTACKS[side][sq] & not_own)
+        pawns &= pawns - 1
+    while knights:
+        sq = lsb(knights)
+        add_moves(moves, base + KNIGHT, sq, KNIGHT_ATTACKS[sq] & not_own)
+        knights &= knights - 1
+    while bishops:
+        sq = lsb(bishops)
+        add_moves(moves, base + BISHOP, sq, slider_attacks(sq, occ, 4, 8) & not_own)
+        bishops &= bishops - 1
+    while rooks:
+        sq = lsb(rooks)
+        add_moves(moves, base + ROOK, sq, slider_attacks(sq, occ, 0, 4) & not_own)
+        rooks &= rooks - 1
+    while queens:
+        sq = lsb(queens)
+        add_moves(moves, base + QUEEN, sq, slider_attacks(sq, occ, 0, 8) & not_own)
+        queens &= queens - 1
+    while kings:
+        sq = lsb(kings)
+        add_moves(moves, base + KING, sq, KING_ATTACKS[sq] & not_own)
+        kings &= kings - 1
+    return moves
+
+cpdef int evaluate_board(pos):
+    """Evaluate the board and return a score."""
+    cdef u64 bb[12]
+    bb[:] = [pos.pawns_w, pos.knights_w, pos.bishops_w, pos.rooks_w, pos.queens_w, pos.kings_w,
+             pos.pawns_b, pos.knights_b, pos.bishops_b, pos.rooks_b, pos.queens_b, pos.kings_b]
+    cdef int score = 0, piece
+    for piece in range(12):
+        score += PIECE_VALUES[piece] * __builtin_popcountll(bb[piece])
+    return score
@@ -0,0 +1,102 @@
+"""Numba-compiled bitboard move generator for engine_core.
+
+engine_core imports generate_moves from here when the Cython movegen
+extension is not built and Numba is installed, and keeps its pure-Python
+version otherwise. All three produce the same moves in the same order.
+"""
+import numpy as np
+from numba import njit
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+BLACK = 6
+
+# Rook directions are 0-3 and bishop directions 4-7, in engine_core's order.
+KING_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+DIRECTIONS = np.array(KING_OFFSETS, dtype=np.int64)
+KNIGHT_OFFSETS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (2, -1), (2, 1), (1, -2), (1, 2))
+
+def _leaper_attacks(offsets):
+    """Precompute the target mask of a single-step piece for every square."""
+    table = np.zeros(64, dtype=np.uint64)
+    for sq in range(64):
+        x, y = divmod(sq, 8)
+        for dx, dy in offsets:
+            if 0 <= x + dx < 8 and 0 <= y + dy < 8:
+                table[sq] |= np.uint64(1 << ((x + dx) * 8 + y + dy))
+    return table
+
+KNIGHT_ATTACKS = _leaper_attacks(KNIGHT_OFFSETS)
+KING_ATTACKS = _leaper_attacks(KING_OFFSETS)
+# White pawns move towards x = 0, black pawns towards x = 7.
+PAWN_ATTACKS = np.stack((
+    _leaper_attacks(((-1, 0), (-1, -1), (-1, 1))),
+    _leaper_attacks(((1, 0), (1, -1), (1, 1))),
+))
+
+@njit(cache=True)
+def _lsb(bb):
+    """Index of the lowest set bit of a non-zero mask."""
+    sq = 0
+    while not (bb >> np.uint64(sq)) & np.uint64(1):
+        sq += 1
+    return sq
+
+@njit(cache=True)
+def _slider_attacks(sq, occ, first, last):
+    """Walk directions first..last-1 from sq, stopping at the first blocker of each."""
+    attacks = np.uint64(0)
+    x, y = sq // 8, sq % 8
+    for d in range(first, last):
+        dx, dy = DIRECTIONS[d, 0], DIRECTIONS[d, 1]
+        nx, ny = x + dx, y + dy
+        while 0 <= nx < 8 and 0 <= ny < 8:
+            bit = np.uint64(1) << np.uint64(nx * 8 + ny)
+            attacks |= bit
+            if occ & bit:
+                break
+            nx += dx
+            ny += dy
+    return attacks
+
+@njit('int64[:, :](uint64[:], uint64, uint64, int64, int64)', cache=True)
+def _generate(pieces, own, occ, base, side):
+    """Return an (N, 3) array of (piece, from, to) moves for the six masks in pieces."""
+    moves = np.empty((256, 3), dtype=np.int64)
+    count = 0
+    not_own = ~own
+    for kind in range(6):
+        bb = pieces[kind]
+        while bb:
+            sq = _lsb(bb)
+            if kind == PAWN:
+                targets = PAWN_ATTACKS[side, sq]
+            elif kind == KNIGHT:
+                targets = KNIGHT_ATTACKS[sq]
+            elif kind == BISHOP:
+                targets = _slider_attacks(sq, occ, 4, 8)
+            elif kind == ROOK:
+                targets = _slider_attacks(sq, occ, 0, 4)
+            elif kind == QUEEN:
+                targets = _slider_attacks(sq, occ, 0, 8)
+            else:
+                targets = KING_ATTACKS[sq]
+            targets &= not_own
+            while targets:
+                moves[count, 0] = base + kind
+                moves[count, 1] = sq
+                moves[count, 2] = _lsb(targets)
+                count += 1
+                targets &= targets - np.uint64(1)
+            bb &= bb - np.uint64(1)
+    return moves[:count]
+
+def generate_moves(pos, is_white):
+    """Generate all possible moves for the current player."""
+    occ = pos.occ_w | pos.occ_b
+    if is_white:
+        pieces = (pos.pawns_w, pos.knights_w, pos.bishops_w, pos.rooks_w, pos.queens_w, pos.kings_w)
+        moves = _generate(np.array(pieces, dtype=np.uint64), pos.occ_w, occ, 0, 0)
+    else:
+        pieces = (pos.pawns_b, pos.knights_b, pos.bishops_b, pos.rooks_b, pos.queens_b, pos.kings_b)
+        moves = _generate(np.array(pieces, dtype=np.uint64), pos.occ_b, occ, BLACK, 1)
+    return list(map(tuple, moves.tolist()))